@@ -1,20 +1,174 @@
 import sys
+import html
+import bisect
+import atexit
+import random
+import string
 import sqlite3
+import threading
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
                              QWidget, QLabel, QLineEdit, QPushButton, QTextEdit,
                              QTableView, QMessageBox, QHeaderView, QFrame, 
                              QScrollArea, QSplitter, QAbstractItemView, QDialog,
                              QDialogButtonBox, QTextBrowser, QTabWidget, QGroupBox,
                              QFormLayout, QComboBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex, QVariant
+from PyQt6.QtCore import (Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex,
+                          QObject, QRunnable, QThreadPool)
 from PyQt6.QtGui import QFont, QFontDatabase, QAction 
 
+# SQLite's NOCASE collation folds ASCII letters only, used to mirror its sort order
+NOCASE_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# HTML template for a single translation result
+RESULT_TEMPLATE = """
+            <div style='border: 1px solid #ccc; margin: 10px 0; padding: 10px; background-color: #f9f9f9;'>
+                <h4>{english} ↔ {khmer}</h4>
+                <p><strong>Type:</strong> {word_type} | <strong>ID:</strong> {word_id}</p>
+                {definition}
+                {example}
+            </div> 
+            """
+
+# HTML template shown when a search has no matches
+NO_RESULTS_TEMPLATE = """
+            <h3>No results found for '{search_term}'</h3>
+            <p><strong>Search Details:</strong></p>
+            <ul>
+                <li>Search Direction: {search_direction}</li>
+                <li>Search Type: {search_type}</li>
+                <li>Search Term: {search_term}</li>
+            </ul>
+            <p><strong>Suggestions:</strong></p>
+            <ul>
+                <li>Check spelling</li>
+                <li>Try simpler words</li>
+                <li>Use the Dictionary Manager to add new words</li>
+            </ul>
+            """
+
+# HTML template for the word details dialog
+DETAILS_TEMPLATE = """
+            <h2 style='color: #2E7D32;'>{english} ↔ {khmer}</h2>
+            <p><strong>Word ID:</strong> {word_id}</p>
+            <p><strong>Type:</strong> {word_type}</p>
+            <p><strong>Definition:</strong> {definition}</p>
+            <p><strong>Example:</strong> {example}</p>
+            <p><strong>Created:</strong> {created}</p>
+            <p><strong>Updated:</strong> {updated}</p>
+            """
+
+# Columns of the dictionary table, English words compare case-insensitively
+DICTIONARY_COLUMNS = '''
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    english_word TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    khmer_word TEXT NOT NULL,
+    word_type TEXT DEFAULT 'noun',
+    definition TEXT,
+    example_sentence TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+'''
+
+# Schema version stored in PRAGMA user_version, raised whenever existing files need migrating
+SCHEMA_VERSION = 1
+
+# Secondary indexes and the schema version stamp, applied after the table is (re)built
+SCHEMA_INDEXES = '''
+    CREATE INDEX IF NOT EXISTS idx_khmer ON dictionary(khmer_word COLLATE NOCASE);
+    PRAGMA user_version = %d;
+''' % SCHEMA_VERSION
+
+# Fixed UPDATE statement so SQLite reuses one prepared plan; a NULL parameter keeps the current value
+UPDATE_SQL = '''
+    UPDATE dictionary SET
+        english_word = COALESCE(?, english_word),
+        khmer_word = COALESCE(?, khmer_word),
+        word_type = COALESCE(?, word_type),
+        definition = COALESCE(?, definition),
+        example_sentence = COALESCE(?, example_sentence),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+
+# Application stylesheet, filled in with the font family (fam) and point size (sz)
+STYLESHEET_TEMPLATE = """
+    QMainWindow{{
+        background-color: #f5f5f5;
+        font-family: '{fam}';
+        font-size: {sz}pt;
+    }}
+    QTabWidget::pane{{
+        border: 1px solid #c0c0c0;
+        background-color: white;
+        font-family: '{fam}';
+        font-size: {sz}pt;
+    }}
+    QTabBar::tab{{
+        background-color: #e0e0e0;
+        padding: 8px 16px;
+        margin-right: 2px;
+        font-family: '{fam}';
+        font-size: {sz}pt;
+    }}
+    QTabBar::tab:selected{{
+        background-color: white;
+        border-bottom: 2px solid #4a90e2;
+    }}
+    QGroupBox{{
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 1ex;
+        padding-top: 10px;
+        font-family: '{fam}';
+        font-size: {sz}pt;
+    }}
+    QGroupBox::title{{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        font-family: '{fam}';
+        font-size: {sz}pt;
+    }}
+    QLineEdit, QComboBox, QPushButton, QTextEdit, QTextBrowser{{
+        font-family: '{fam}';
+        font-size: {sz}pt;
+        padding: 5px;
+    }}
+    QTableView{{
+        font-family: '{fam}';
+        font-size: {sz}pt;
+        gridline-color: #d0d0d0;
+    }}
+    QHeaderView::section{{
+        background-color: #e8e8e8;
+        padding: 8px;
+        border: 1px solid #c0c0c0;
+        font-family: '{fam}';
+        font-size: {sz}pt;
+        font-weight: bold;
+    }}
+    QLabel{{
+        font-family: '{fam}';
+        font-size: {sz}pt;
+    }}
+    * {{
+        font-family: '{fam}';
+        font-size: {sz}pt;
+    }}
+"""
+
 class FontManager:
     """Manage Khmer OS Siemreap font for the application - Single font size 11"""
     
+    _families_cache = None # installed font families, enumerated once per process
+    
     def __init__(self):
         self.khmer_font = None
+        self._bold_font = None
+        self._font_family = None
         self.font_size = 11 # single font size for entire app
+        self._font_cache = {} # (size, bold) -> QFont
         self.init_fonts()
         
     def init_fonts(self):
@@ -23,13 +177,14 @@ class FontManager:
             "Khmer OS Siemreap"
         ]
         
-        try:
-            available_families = QFontDatabase().families()
-        except:
-            available_families = []
+        if FontManager._families_cache is None:
+            try:
+                FontManager._families_cache = set(QFontDatabase().families())
+            except:
+                FontManager._families_cache = set()
         
         for font_name in preferred_fonts:
-            if font_name in available_families:
+            if font_name in FontManager._families_cache:
                 self.khmer_font = QFont(font_name, self.font_size)
                 break
         
@@ -42,31 +197,42 @@ class FontManager:
         self.khmer_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias | QFont.StyleStrategy.PreferQuality)
         self.khmer_font.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
         
+        self._bold_font = QFont(self.khmer_font)
+        self._bold_font.setWeight(QFont.Weight.Bold)
+        self._font_family = self.khmer_font.family()
+        
     def get_font(self, size=None, bold=False):
         """Get the standard font with specified size and weight"""
-        if size is None:
-            size = self.font_size
-        font = QFont(self.khmer_font)
-        font.setPointSize(size)
-        if bold:
-            font.setWeight(QFont.Weight.Bold)
+        # Default size is by far the most common request, share those fonts directly
+        if size is None or size == self.font_size:
+            return self._bold_font if bold else self.khmer_font
+        font = self._font_cache.get((size, bold))
+        if font is None:
+            font = QFont(self.khmer_font)
+            font.setPointSize(size)
+            if bold:
+                font.setWeight(QFont.Weight.Bold)
+            self._font_cache[(size, bold)] = font
         return font
     
     def get_font_family(self):
         """Get the font family name"""
-        return self.khmer_font.family()
+        return self._font_family
     
     def apply_font(self, widget, size=None, bold=False):
-        """Apply font to any widget recursively"""
-        if size is None:
-            size = self.font_size
+        """Apply font to a widget, children inherit it through Qt font propagation"""
+        try:
+            widget.setFont(self.get_font(size, bold))
+        except Exception as e:
+            print(f"Font application error: {e}")
+    
+    def apply_font_recursive(self, widget, size=None, bold=False):
+        """Apply font to a widget and explicitly to all of its existing children"""
         try:
             font = self.get_font(size, bold)
             widget.setFont(font)
-            # Apply to all child widgets recursively
             for child in widget.findChildren(QWidget):
-                if hasattr(child, 'setFont'):
-                    child.setFont(font)
+                child.setFont(font)
         except Exception as e:
             print(f"Font application error: {e}")
         
@@ -78,7 +244,7 @@ class FontManager:
         msg_box.setText(text)
         
         # Apply font to message box and all children
-        self.apply_font(msg_box, self.font_size)
+        self.apply_font_recursive(msg_box, self.font_size)
         
         if buttons:
             msg_box.setStandardButtons(buttons)
@@ -88,10 +254,45 @@ class FontManager:
 class DictionaryTableModel(QAbstractTableModel):
     """Table model for dictionary entries with full CRUD support"""
     
+    ENGLISH_COLUMN = 1
+    TYPE_COLUMN = 3
+    PAGE_SIZE = 200
+    
     def __init__(self, data=None):
         super().__init__()
         self.headers = ["ID", "English", "Khmer", "Type", "Definition", "Example"]
-        self._data = data or []
+        self._data = list(data) if data else []
+        self._cols = self._build_columns(self._data)
+        self._row_by_id = self._index_rows(self._data)
+        # Lazy loading state, fetch_page(after_english, limit) returns the next page
+        self._fetch_page = None
+        self._last_key = None
+        self._has_more = False
+        
+    @staticmethod
+    def _format_value(value):
+        """Stringify a cell value once, outside the paint path"""
+        return str(value) if value is not None else ""
+    
+    def _build_columns(self, rows):
+        """Store display strings column-major so paints walk one list per column"""
+        # Only first 6 columns, excluding created_at and updated_at
+        columns = list(zip(*rows))[:6] if rows else [()] * 6
+        cols = [[self._format_value(value) for value in column] for column in columns]
+        # Word types come from a small fixed set, so every row can share one string per type
+        cols[self.TYPE_COLUMN] = [sys.intern(value) for value in cols[self.TYPE_COLUMN]]
+        return cols
+    
+    def _format_cells(self, row_data):
+        """Stringify the displayed columns of a single row"""
+        cells = [self._format_value(value) for value in row_data[:6]]
+        cells[self.TYPE_COLUMN] = sys.intern(cells[self.TYPE_COLUMN])
+        return cells
+    
+    @staticmethod
+    def _index_rows(rows):
+        """Map word ID to row position for targeted updates"""
+        return {row_data[0]: row for row, row_data in enumerate(rows)}
         
     def rowCount(self, parent=QModelIndex()):
         return len(self._data)
@@ -100,31 +301,73 @@ class DictionaryTableModel(QAbstractTableModel):
         return len(self.headers)
     
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
-            return QVariant()
-        
-        if role == Qt.ItemDataRole.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row < len(self._data):
-                # Return data excluding created_at and updated_at column
-                data_item = self._data[row]
-                if col < 6: # Only first 6 columns
-                    value = data_item[col] if data_item[col] is not None else ""
-                    return str(value)
-                
-        return QVariant()
+        # Qt asks for many roles per cell; bail out early on everything but display
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        
+        row = index.row()
+        if row < len(self._data):
+            return self._cols[index.column()][row]
+        return None
     
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
             if section < len(self.headers):
                 return self.headers[section]
-        return QVariant()
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return self._has_more and not parent.isValid()
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Load the next page when the view scrolls near the last loaded row"""
+        if not self.canFetchMore(parent):
+            return
+        rows = self._next_page()
+        if rows:
+            start = len(self._data)
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+            self._append_rows(rows)
+            self.endInsertRows()
+    
+    def _next_page(self):
+        """Fetch the page after the last loaded English word (keyset pagination)"""
+        return self._take_page(self._fetch_page(self._last_key, self.PAGE_SIZE))
+    
+    def _take_page(self, rows):
+        """Record where a fetched page ends so the next one continues after it"""
+        self._has_more = len(rows) == self.PAGE_SIZE
+        if rows:
+            self._last_key = rows[-1][self.ENGLISH_COLUMN]
+        return rows
+    
+    def _append_rows(self, rows):
+        start = len(self._data)
+        self._data.extend(rows)
+        for column, cells in zip(self._cols, self._build_columns(rows)):
+            column.extend(cells)
+        self._row_by_id.update((row_data[0], start + i) for i, row_data in enumerate(rows))
+    
+    def set_page_source(self, fetch_page, first_page=None):
+        """Show all words, loading them lazily one page at a time"""
+        self.beginResetModel()
+        self._data = []
+        self._cols = self._build_columns(self._data)
+        self._row_by_id = {}
+        self._fetch_page = fetch_page
+        self._last_key = None
+        # The first page may already have been read off the GUI thread
+        self._append_rows(self._next_page() if first_page is None else self._take_page(first_page))
+        self.endResetModel()
     
     def update_data(self, new_data):
         """Update the model with new data"""
         self.beginResetModel()
-        self._data = new_data or []
+        self._data = list(new_data) if new_data else []
+        self._cols = self._build_columns(self._data)
+        self._row_by_id = self._index_rows(self._data)
+        self._fetch_page = None
+        self._has_more = False
         self.endResetModel()
     
     def get_row_data(self, row):
@@ -136,42 +379,117 @@ class DictionaryTableModel(QAbstractTableModel):
     def add_row(self, row_data):
         """Add a new row to the model"""
         self.beginInsertRows(QModelIndex(), len(self._data), len(self._data))
+        self._row_by_id[row_data[0]] = len(self._data)
         self._data.append(row_data)
+        for column, cell in zip(self._cols, self._format_cells(row_data)):
+            column.append(cell)
+        self.endInsertRows()
+    
+    def insert_row(self, row_data):
+        """Insert a row at its sorted English position"""
+        # Compare the way SQLite orders english_word (COLLATE NOCASE)
+        key = row_data[self.ENGLISH_COLUMN].translate(NOCASE_TABLE)
+        if self._has_more and key > self._last_key.translate(NOCASE_TABLE):
+            # Not paged in yet, a later fetchMore will load it
+            return False
+        keys = [value.translate(NOCASE_TABLE) for value in self._cols[self.ENGLISH_COLUMN]]
+        row = bisect.bisect_left(keys, key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._data.insert(row, row_data)
+        for column, cell in zip(self._cols, self._format_cells(row_data)):
+            column.insert(row, cell)
+        self._row_by_id = self._index_rows(self._data)
         self.endInsertRows()
+        return True
     
     def remove_row(self, row):
         """Remove a row from the model"""
         if 0 <= row < len(self._data):
             self.beginRemoveRows(QModelIndex(), row, row)
             del self._data[row]
+            for column in self._cols:
+                del column[row]
+            self._row_by_id = self._index_rows(self._data)
             self.endRemoveRows()
             return True
         return False
+    
+    def remove_row_by_id(self, word_id):
+        """Remove the row for a word ID, if it is loaded"""
+        row = self._row_by_id.get(word_id)
+        if row is None:
+            return False
+        return self.remove_row(row)
+    
+    def update_row(self, word_id, row_data):
+        """Replace the row for a word ID in place and repaint only that row"""
+        row = self._row_by_id.get(word_id)
+        if row is None:
+            return False
+        if row_data[self.ENGLISH_COLUMN] != self._data[row][self.ENGLISH_COLUMN]:
+            # A renamed word moves to its new sorted position, or out of the
+            # loaded range so that a later fetchMore loads it exactly once
+            self.remove_row(row)
+            self.insert_row(row_data)
+            return True
+        self._data[row] = row_data
+        for column, cell in zip(self._cols, self._format_cells(row_data)):
+            column[row] = cell
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1))
+        return True
         
 class DictionaryDatabase:
     """Manage the SQLite database for dictionary operations"""
     
     def __init__(self, db_path="khmer_english_dictionary.db"):
         self.db_path = db_path
+        # Single long-lived connection shared by every operation
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                    cached_statements=256)
+        self.conn.row_factory = sqlite3.Row
+        self._stmts = {} # SQL text -> reusable cursor
+        self._lock = threading.Lock() # serializes worker-thread and GUI access to the connection
         self.init_database()
-        
+        atexit.register(self.close)
+
     def init_database(self):
         """Initialize the SQLite database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS dictionary(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                english_word TEXT NOT NULL UNIQUE,
-                khmer_word TEXT NOT NULL,
-                word_type TEXT DEFAULT 'noun',
-                definition TEXT,
-                example_sentence TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''') 
+        cursor = self.conn.cursor()
+
+        # Connection settings submitted as a single batch
+        cursor.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-64000;
+        ''')
+        
+        # english_word is NOCASE itself, so its UNIQUE index serves case-insensitive
+        # prefix LIKE lookups and duplicates differing only by case are rejected
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'dictionary'"
+        ).fetchone()
+        if exists and version < SCHEMA_VERSION:
+            # Tables from before user_version was set lack the collation and are rebuilt once;
+            # the AUTOINCREMENT counter moves to the new table so deleted ids are not reused
+            cursor.executescript('''
+                BEGIN;
+                CREATE TABLE dictionary_new(%s);
+                INSERT INTO dictionary_new SELECT * FROM dictionary;
+                DELETE FROM sqlite_sequence WHERE name = 'dictionary_new';
+                UPDATE sqlite_sequence SET name = 'dictionary_new' WHERE name = 'dictionary';
+                DROP TABLE dictionary;
+                ALTER TABLE dictionary_new RENAME TO dictionary;
+                %s
+                COMMIT;
+            ''' % (DICTIONARY_COLUMNS, SCHEMA_INDEXES))
+        else:
+            cursor.executescript('''
+                CREATE TABLE IF NOT EXISTS dictionary(%s);
+                %s
+            ''' % (DICTIONARY_COLUMNS, SCHEMA_INDEXES))
         
         cursor.execute("SELECT COUNT(*) FROM dictionary")
         if cursor.fetchone()[0] == 0:
@@ -189,137 +507,239 @@ class DictionaryDatabase:
                 ("book", "សៀវភៅ", "noun", "Written or printed work", "I am reading a book"),
                 ("student", "សិស្ស", "noun", "Person who studies", "She is a good student")
             ]
-        
-            cursor.executemany('''
-                INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
-                VALUES(?, ?, ?, ?, ?)
-                ''', sample_data)
-        
-        conn.commit()
-        conn.close()
-        
+
+            # Seed in one transaction without per-statement syncs
+            cursor.execute("PRAGMA synchronous=OFF")
+            try:
+                self.bulk_insert(sample_data)
+            finally:
+                cursor.execute("PRAGMA synchronous=NORMAL")
+
+    def close(self):
+        """Close the shared database connection"""
+        # Wait for any statement a worker thread is still running
+        with self._lock:
+            self._stmts.clear()
+            self.conn.close()
+
+    def _exec(self, sql, params=()):
+        """Execute SQL on a cursor reused for that statement text"""
+        cursor = self._stmts.get(sql)
+        if cursor is None:
+            cursor = self._stmts[sql] = self.conn.cursor()
+        return cursor.execute(sql, params)
+
     def create_word(self, english_word, khmer_word, word_type="noun", definition="", example=""):
         """Create operation - Add new word to dictionary"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
-                VALUES(?,?,?,?,?)         
-            ''', (english_word.lower().strip(), khmer_word.strip(), word_type, definition, example))
-            conn.commit()
-            word_id = cursor.lastrowid
-            conn.close()
-            return word_id
-        except sqlite3.IntegrityError:
-            conn.close()
-            raise ValueError(f"Word '{english_word}' already exists in dictionary")
-        except Exception as e:
-            conn.close()
-            raise ValueError(f"Database error: {str(e)}")
-        
+        with self._lock:
+            try:
+                cursor = self._exec('''
+                    INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
+                    VALUES(?,?,?,?,?)
+                ''', (english_word.strip(), khmer_word.strip(), word_type, definition, example))
+                return cursor.lastrowid
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Word '{english_word}' already exists in dictionary")
+            except Exception as e:
+                raise ValueError(f"Database error: {str(e)}")
+
+    def bulk_insert(self, rows):
+        """CREATE operation - Add many words in a single transaction"""
+        rows = [(english_word.strip(), khmer_word.strip(), word_type, definition, example)
+                for english_word, khmer_word, word_type, definition, example in rows]
+        with self._lock:
+            cursor = self.conn.cursor()
+            try:
+                # One transaction for the whole batch instead of a commit per row,
+                # the connection context commits it or rolls it back on error
+                with self.conn:
+                    cursor.execute("BEGIN")
+                    cursor.executemany('''
+                        INSERT INTO dictionary (english_word, khmer_word, word_type, definition, example_sentence)
+                        VALUES(?, ?, ?, ?, ?)
+                    ''', rows)
+                return cursor.rowcount
+            except sqlite3.IntegrityError as e:
+                raise ValueError(f"Import contains words that already exist in dictionary: {str(e)}")
+            except Exception as e:
+                raise ValueError(f"Database error: {str(e)}")
+
     def read_word(self, search_term, search_type="english"):
         """READ operation - Searching for words"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            if search_type == "english":
-                cursor.execute('''
-                    SELECT * FROM dictionary
-                    WHERE english_word LIKE ? OR english_word = ?
-                    ORDER BY english_word       
-                ''', (f"%{search_term.lower()}%", search_term.lower()))
-            else:
-                cursor.execute('''
-                    SELECT * FROM dictionary
-                    WHERE khmer_word LIKE ?
-                    ORDER BY khmer_word
-                ''', (f"%{search_term}%",))
+        with self._lock:
+            try:
+                if search_type == "english":
+                    query = '''
+                        SELECT * FROM dictionary
+                        WHERE english_word LIKE ?
+                        ORDER BY english_word
+                    '''
+                else:
+                    query = '''
+                        SELECT * FROM dictionary
+                        WHERE khmer_word LIKE ?
+                        ORDER BY khmer_word
+                    '''
             
-            results = cursor.fetchall()
-            conn.close()
-            return results
-        except Exception as e:
-            conn.close()
-            return []
-        
+                # Indexed prefix match first, full substring scan only as a fallback
+                results = self._exec(query, (f"{search_term}%",)).fetchall()
+                if not results:
+                    results = self._exec(query, (f"%{search_term}%",)).fetchall()
+                return results
+            except Exception as e:
+                return []
+
+    def read_by_id(self, word_id):
+        """READ operation - Get a single word by ID"""
+        with self._lock:
+            try:
+                return self._exec("SELECT * FROM dictionary WHERE id = ?", (word_id,)).fetchone()
+            except Exception as e:
+                return None
+
+    def search_words(self, text):
+        """READ operation - Filter words by English, Khmer, type or definition (LIKE ignores case)"""
+        with self._lock:
+            try:
+                # Match the text literally, LIKE would otherwise treat % and _ as wildcards
+                escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                cursor = self._exec('''
+                    SELECT * FROM dictionary
+                    WHERE english_word LIKE ?1 ESCAPE '\\' OR khmer_word LIKE ?1 ESCAPE '\\'
+                        OR word_type LIKE ?1 ESCAPE '\\' OR definition LIKE ?1 ESCAPE '\\'
+                    ORDER BY english_word
+                ''', (f"%{escaped}%",))
+                return cursor.fetchall()
+            except Exception as e:
+                return []
+
+    def read_words_page(self, after_english=None, limit=200):
+        """READ operation - Get the next page of words ordered by English word"""
+        with self._lock:
+            try:
+                if after_english is None:
+                    cursor = self._exec(
+                        "SELECT * FROM dictionary ORDER BY english_word LIMIT ?", (limit,)
+                    )
+                else:
+                    cursor = self._exec(
+                        "SELECT * FROM dictionary WHERE english_word > ? ORDER BY english_word LIMIT ?",
+                        (after_english, limit)
+                    )
+                return cursor.fetchall()
+            except Exception as e:
+                return []
+
+    def read_first_page(self, limit=200):
+        """READ operation - Get the total word count and the first page of words"""
+        return self.get_total_count(), self.read_words_page(None, limit)
+
+    def get_total_count(self):
+        """Get the total number of words in the dictionary"""
+        with self._lock:
+            try:
+                return self._exec("SELECT COUNT(*) FROM dictionary").fetchone()[0]
+            except Exception as e:
+                return 0
+
+    def get_type_counts(self):
+        """Get the number of words for each word type"""
+        with self._lock:
+            try:
+                cursor = self._exec("SELECT word_type, COUNT(*) FROM dictionary GROUP BY word_type")
+                return dict(cursor.fetchall())
+            except Exception as e:
+                return {}
+
     def read_all_words(self):
         """READ operation - Get all words"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT * FROM dictionary ORDER BY english_word")
-            results = cursor.fetchall()
-            conn.close()
-            return results
-        except Exception as e:
-            conn.close()
-            return []
-        
+        with self._lock:
+            try:
+                cursor = self._exec("SELECT * FROM dictionary ORDER BY english_word")
+                results = []
+                while chunk := cursor.fetchmany(512):
+                    results.extend(chunk)
+                return results
+            except Exception as e:
+                return []
+
     def update_word(self, word_id, english_word=None, khmer_word=None, word_type=None, definition=None, example=None):
         """Update operation - Modify existing word"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        try:
-            updates = []
-            params = []
-            if english_word is not None:
-                updates.append("english_word = ?")
-                params.append(english_word.lower().strip())
-            if khmer_word is not None:
-                updates.append("khmer_word = ?")
-                params.append(khmer_word.strip())
-            if word_type is not None:
-                updates.append("word_type = ?")
-                params.append(word_type)
-            if definition is not None:
-                updates.append("definition = ?")
-                params.append(definition)  
-            if example is not None:
-                updates.append("example_sentence = ?")
-                params.append(example)
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            params.append(word_id)
-            if updates:
-                query = f"UPDATE dictionary SET {', '.join(updates)} WHERE id = ?"
-                cursor.execute(query, params)
-                affected_rows = cursor.rowcount
-                conn.commit()
-                conn.close()
-                return affected_rows > 0
-            conn.close()
-            return False
-        except Exception as e:
-            conn.close()
-            raise ValueError(f"Update error: {str(e)}")
-    
+        if english_word is not None:
+            english_word = english_word.strip()
+        if khmer_word is not None:
+            khmer_word = khmer_word.strip()
+        with self._lock:
+            try:
+                cursor = self._exec(UPDATE_SQL, (english_word, khmer_word, word_type, definition, example, word_id))
+                return cursor.rowcount > 0
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Word '{english_word}' already exists in dictionary")
+            except Exception as e:
+                raise ValueError(f"Update error: {str(e)}")
+
     def delete_word(self, word_id):
         """DELETE operation - Remove word from dictionary"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        try:
-            cursor.execute("DELETE FROM dictionary WHERE id = ?", (word_id,))
-            affected_rows = cursor.rowcount
-            conn.commit()
-            conn.close()
-            return affected_rows > 0
-        except Exception as e:
-            conn.close()
-            raise ValueError(f"Delete error: {str(e)}")
-        
+        with self._lock:
+            try:
+                return self._exec("DELETE FROM dictionary WHERE id = ?", (word_id,)).rowcount > 0
+            except Exception as e:
+                raise ValueError(f"Delete error: {str(e)}")
+
     def get_random_words(self, limit=5):
         """Get random words for display"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            try:
+                max_id = self._exec("SELECT MAX(id) FROM dictionary").fetchone()[0]
+                if not max_id:
+                    return []
+            
+                # Sample ids and fetch them by primary key instead of sorting the whole table
+                found = {}
+                for _ in range(5):
+                    needed = limit - len(found)
+                    if needed <= 0:
+                        break
+                    ids = random.sample(range(1, max_id + 1), min(needed, max_id))
+                    placeholders = ",".join("?" * len(ids))
+                    for row in self._exec(f"SELECT * FROM dictionary WHERE id IN ({placeholders})", ids):
+                        found.setdefault(row[0], row)
+            
+                if len(found) < limit:
+                    # Too many gaps from deleted ids, fall back to a random sort of the ids only
+                    # and fetch just the chosen rows by primary key
+                    results = self._exec('''
+                        SELECT * FROM dictionary
+                        WHERE id IN (SELECT id FROM dictionary ORDER BY RANDOM() LIMIT ?)
+                    ''', (limit,)).fetchall()
+                else:
+                    results = list(found.values())[:limit]
+                random.shuffle(results)
+                return results
+            except Exception as e:
+                return []
+        
+class WorkerSignals(QObject):
+    """Signals used by DbTask to report back to the GUI thread"""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    
+class DbTask(QRunnable):
+    """Run a database call on a QThreadPool worker thread"""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+        
+    def run(self):
         try:
-            cursor.execute("SELECT * FROM dictionary ORDER BY RANDOM() LIMIT ?", (limit,))
-            results = cursor.fetchall()
-            conn.close()
-            return results
+            result = self.fn(*self.args)
         except Exception as e:
-            conn.close()
-            return []
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
         
 class WordDetailsDialog(QDialog):
     """Dialog for viewing detailed word information"""
@@ -335,33 +755,29 @@ class WordDetailsDialog(QDialog):
         self.setModal(True)
         self.resize(500, 400)
         
-        # Apply font to dialog
-        self.font_manager.apply_font(self)
-        
         layout = QVBoxLayout()
         
         if self.word_data:
             word_id, english, khmer, word_type, definition, example, created, updated = self.word_data
             
             # Display word information
-            info_text = f"""
-            <h2 style='color: #2E7D32;'>{english.title()} ↔ {khmer}</h2>
-            <p><strong>Word ID:</strong> {word_id}</p>
-            <p><strong>Type:</strong> {word_type.title()}</p>
-            <p><strong>Definition:</strong> {definition or 'No definition provided'}</p>
-            <p><strong>Example:</strong> {example or 'No example provided'}</p>
-            <p><strong>Created:</strong> {created}</p>
-            <p><strong>Updated:</strong> {updated}</p>
-            """
+            info_text = DETAILS_TEMPLATE.format(
+                english=html.escape(english.title()),
+                khmer=html.escape(khmer),
+                word_id=word_id,
+                word_type=html.escape(word_type.title()),
+                definition=html.escape(definition or 'No definition provided'),
+                example=html.escape(example or 'No example provided'),
+                created=created,
+                updated=updated
+            )
                 
             details_browser = QTextBrowser()
             details_browser.setHtml(info_text)
-            self.font_manager.apply_font(details_browser)
             layout.addWidget(details_browser)
                 
         # Buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
-        self.font_manager.apply_font(button_box)
         button_box.accepted.connect(self.accept)
         layout.addWidget(button_box)
             
@@ -377,9 +793,6 @@ class TranslatorWidgets(QWidget):
         self.init_ui()
         
     def init_ui(self):
-        # Apply font to entire widget
-        self.font_manager.apply_font(self)
-        
         layout = QVBoxLayout()
         
         # Title section
@@ -392,7 +805,6 @@ class TranslatorWidgets(QWidget):
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         subtitle = QLabel("រចនានុក្រមអង់គ្លេស-ខ្មែរ")
-        self.font_manager.apply_font(subtitle)
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         title_layout.addWidget(title)
@@ -403,29 +815,23 @@ class TranslatorWidgets(QWidget):
         # Search section
         search_group = QGroupBox("Search Translation")
         search_group.setFixedHeight(550)
-        self.font_manager.apply_font(search_group, bold=True)
         search_layout = QVBoxLayout()
         
         # Search controls
         controls_layout = QHBoxLayout()
         
         direction_label = QLabel("Direction:")
-        self.font_manager.apply_font(direction_label)
         
         self.search_combo = QComboBox()
         self.search_combo.addItems(["English ➞ Khmer", "Khmer ➞ English"])
-        self.font_manager.apply_font(self.search_combo)
         
         word_label = QLabel("Word:")
-        self.font_manager.apply_font(word_label)
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Type word to translate...")
-        self.font_manager.apply_font(self.search_input)
         self.search_input.returnPressed.connect(self.search_word)
         
         self.search_button = QPushButton("Search")
-        self.font_manager.apply_font(self.search_button)
         self.search_button.clicked.connect(self.search_word)
         self.search_button.setDefault(True)
         
@@ -439,11 +845,9 @@ class TranslatorWidgets(QWidget):
         
         # Results display
         results_label = QLabel("Results:")
-        self.font_manager.apply_font(results_label)
         
         self.results_display = QTextBrowser()
         self.results_display.setMaximumHeight(500)
-        self.font_manager.apply_font(self.results_display)
         
         search_layout.addWidget(results_label)
         search_layout.addWidget(self.results_display)
@@ -455,11 +859,9 @@ class TranslatorWidgets(QWidget):
         button_layout = QHBoxLayout()
         
         self.clear_button = QPushButton("Clear")
-        self.font_manager.apply_font(self.clear_button)
         self.clear_button.clicked.connect(self.clear_search)
         
         self.random_button = QPushButton("Random Word")
-        self.font_manager.apply_font(self.random_button)
         self.random_button.clicked.connect(self.show_random_word)
         
         button_layout.addWidget(self.clear_button)
@@ -492,39 +894,29 @@ class TranslatorWidgets(QWidget):
             self.display_results(results)
             self.word_searched.emit(search_term, search_type)
         else:
-            no_results = f"""
-            <h3>No results found for '{search_term}'</h3>
-            <p><strong>Search Details:</strong></p>
-            <ul>
-                <li>Search Direction: {search_direction}</li>
-                <li>Search Type: {search_type}</li>
-                <li>Search Term: {search_term}</li>
-            </ul>
-            <p><strong>Suggestions:</strong></p>
-            <ul>
-                <li>Check spelling</li>
-                <li>Try simpler words</li>
-                <li>Use the Dictionary Manager to add new words</li>
-            </ul>
-            """
+            no_results = NO_RESULTS_TEMPLATE.format(
+                search_term=html.escape(search_term),
+                search_direction=search_direction,
+                search_type=search_type
+            )
             self.results_display.setHtml(no_results)
     
     def display_results(self, results):
-        html_content = "<h3>Translation Results:</h3>"
+        parts = ["<h3>Translation Results:</h3>"]
         
         for result in results:
             word_id, english, khmer, word_type, definition, example, created, updated = result
             
-            html_content += f"""
-            <div style='border: 1px solid #ccc; margin: 10px 0; padding: 10px; background-color: #f9f9f9;'>
-                <h4>{english.title()} ↔ {khmer}</h4>
-                <p><strong>Type:</strong> {word_type.title()} | <strong>ID:</strong> {word_id}</p>
-                {f"<p><strong>Definition:</strong> {definition}</p>" if definition else ""}
-                {f"<p><strong>Example:</strong> <em>{example}</em></p>" if example else ""}
-            </div> 
-            """
-        
-        self.results_display.setHtml(html_content)
+            parts.append(RESULT_TEMPLATE.format_map({
+                "english": html.escape(english.title()),
+                "khmer": html.escape(khmer),
+                "word_type": html.escape(word_type.title()),
+                "word_id": word_id,
+                "definition": f"<p><strong>Definition:</strong> {html.escape(definition)}</p>" if definition else "",
+                "example": f"<p><strong>Example:</strong> <em>{html.escape(example)}</em></p>" if example else "",
+            }))
+        
+        self.results_display.setHtml("".join(parts))
     
     def clear_search(self):
         self.search_input.clear()
@@ -548,14 +940,16 @@ class DictionaryManagerWidget(QWidget):
         self.db = db
         self.font_manager = font_manager
         self.current_edit_id = None
+        self._total_count = 0 # total entries, counted at the last refresh
+        self._read_generation = 0 # bumped per table read so stale worker results are dropped
+        self._last_filter_text = "" # filter whose complete result is _last_filter_rows
+        self._last_filter_rows = []
+        self._last_filter_keys = None # folded search text per row, built on first narrowing
         self.table_model = DictionaryTableModel()
         self.init_ui()
         self.refresh_dictionary()
         
     def init_ui(self):
-        # Apply font to entire widget
-        self.font_manager.apply_font(self)
-        
         layout = QVBoxLayout()
         
         # Create splitter for form and table
@@ -566,7 +960,6 @@ class DictionaryManagerWidget(QWidget):
         form_layout = QVBoxLayout()
         
         form_group = QGroupBox("Add/Edit Dictionary Entry")
-        self.font_manager.apply_font(form_group, bold=True)
         form_group_layout = QVBoxLayout()
         
         # Create form inputs using QHBoxLayout
@@ -575,50 +968,40 @@ class DictionaryManagerWidget(QWidget):
         # English word
         english_layout = QVBoxLayout()
         english_label = QLabel("English Word:")
-        self.font_manager.apply_font(english_label)
         self.english_input = QLineEdit()
         self.english_input.setPlaceholderText("e.g., computer")
-        self.font_manager.apply_font(self.english_input)
         english_layout.addWidget(english_label)
         english_layout.addWidget(self.english_input)
         
         # Khmer word
         khmer_layout = QVBoxLayout()
         khmer_label = QLabel("Khmer Word:")
-        self.font_manager.apply_font(khmer_label)
         self.khmer_input = QLineEdit()
         self.khmer_input.setPlaceholderText("e.g., កុំព្យូទ័រ")
-        self.font_manager.apply_font(self.khmer_input)
         khmer_layout.addWidget(khmer_label)
         khmer_layout.addWidget(self.khmer_input)
         
         # Word type
         type_layout = QVBoxLayout()
         type_label = QLabel("Word Type:")
-        self.font_manager.apply_font(type_label)
         self.type_combo = QComboBox()
         self.type_combo.addItems(["noun", "verb", "adjective", "adverb", "greeting", "expression", "response"])
-        self.font_manager.apply_font(self.type_combo)
         type_layout.addWidget(type_label)
         type_layout.addWidget(self.type_combo)
         
         # Definition
         definition_layout = QVBoxLayout()
         definition_label = QLabel("Definition:")
-        self.font_manager.apply_font(definition_label)
         self.definition_input = QLineEdit()
         self.definition_input.setPlaceholderText("Brief definition...")
-        self.font_manager.apply_font(self.definition_input)
         definition_layout.addWidget(definition_label)
         definition_layout.addWidget(self.definition_input)
         
         # Example
         example_layout = QVBoxLayout()
         example_label = QLabel("Example:")
-        self.font_manager.apply_font(example_label)
         self.example_input = QLineEdit()
         self.example_input.setPlaceholderText("Example sentence...")
-        self.font_manager.apply_font(self.example_input)
         example_layout.addWidget(example_label)
         example_layout.addWidget(self.example_input)
        
@@ -636,23 +1019,19 @@ class DictionaryManagerWidget(QWidget):
        
         # Create button
         self.add_button = QPushButton("Create Word")
-        self.font_manager.apply_font(self.add_button)
         self.add_button.clicked.connect(self.create_word)
         self.add_button.setDefault(True)
         
         # Update button
         self.update_button = QPushButton("Update Word")
-        self.font_manager.apply_font(self.update_button)
         self.update_button.clicked.connect(self.update_word)
         self.update_button.setVisible(False)
        
         self.cancel_button = QPushButton("Cancel Edit")
-        self.font_manager.apply_font(self.cancel_button)
         self.cancel_button.clicked.connect(self.cancel_edit)
         self.cancel_button.setVisible(False)
         
         self.clear_button = QPushButton("Clear Form")
-        self.font_manager.apply_font(self.clear_button)
         self.clear_button.clicked.connect(self.clear_form)
         
         button_layout.addWidget(self.add_button)
@@ -671,21 +1050,23 @@ class DictionaryManagerWidget(QWidget):
         table_layout = QVBoxLayout()
         
         table_group = QGroupBox("Dictionary Entries")
-        self.font_manager.apply_font(table_group, bold=True)
         table_group_layout = QVBoxLayout()
         
         # Filter for READ operations
         filter_layout = QHBoxLayout()
         filter_label = QLabel("Filter:")
-        self.font_manager.apply_font(filter_label)
         
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Filter entries...")
-        self.font_manager.apply_font(self.filter_input)
         self.filter_input.textChanged.connect(self.filter_dictionary)
         
+        # Debounce filtering so only the last keystroke in a burst hits the database
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._run_filter)
+        
         self.refresh_button = QPushButton("Refresh")
-        self.font_manager.apply_font(self.refresh_button)
         self.refresh_button.clicked.connect(self.refresh_dictionary)
         
         filter_layout.addWidget(filter_label)
@@ -694,9 +1075,10 @@ class DictionaryManagerWidget(QWidget):
         
         # Table view for displaying data
         self.table_view = QTableView()
-        self.font_manager.apply_font(self.table_view)
         self.table_view.setModel(self.table_model)
         self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        # View, edit and delete act on one word, the current row
+        self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table_view.setAlternatingRowColors(True)
         
         # Configure headers
@@ -710,21 +1092,17 @@ class DictionaryManagerWidget(QWidget):
         
         # READ operation - View details
         self.view_button = QPushButton("View Details") 
-        self.font_manager.apply_font(self.view_button)
         self.view_button.clicked.connect(self.view_selected_word)
         
         # UPDATE operation - Edit
         self.edit_button = QPushButton("Edit Selected")
-        self.font_manager.apply_font(self.edit_button)
         self.edit_button.clicked.connect(self.edit_selected_word)
         
         # DELETE operation - Delete
         self.delete_button = QPushButton("Delete Selected")
-        self.font_manager.apply_font(self.delete_button)
         self.delete_button.clicked.connect(self.delete_selected_word)
         
         self.stats_label = QLabel()
-        self.font_manager.apply_font(self.stats_label)
         
         table_button_layout.addWidget(self.view_button)
         table_button_layout.addWidget(self.edit_button)
@@ -765,30 +1143,38 @@ class DictionaryManagerWidget(QWidget):
             msg.exec()
             return
         
-        try:
-            word_id = self.db.create_word(english, khmer, word_type, definition, example)
-            self.clear_form()
-            self.refresh_dictionary()
-            self.word_added.emit(english)
-            
-            msg = self.font_manager.create_message_box(
-                self, QMessageBox.Icon.Information,
-                "Success",
-                f"Word '{english}' ➞ '{khmer}' created successfully!\nWord ID: {word_id}"
-            )  
-            msg.exec()
-        except ValueError as e:
-            msg = self.font_manager.create_message_box(
-                self, QMessageBox.Icon.Warning,
-                "Error",
-                str(e)
-            )
-            msg.exec()
+        # Insert on a worker thread so the GUI keeps painting during the write
+        task = DbTask(self.db.create_word, english, khmer, word_type, definition, example)
+        task.signals.finished.connect(lambda word_id: self.create_finished(word_id, english, khmer))
+        task.signals.error.connect(self.create_failed)
+        QThreadPool.globalInstance().start(task)
+        
+    def create_finished(self, word_id, english, khmer):
+        """Finish CREATE operation once the worker has inserted the word"""
+        self.clear_form()
+        self.add_table_word(word_id)
+        self.word_added.emit(english)
+        
+        msg = self.font_manager.create_message_box(
+            self, QMessageBox.Icon.Information,
+            "Success",
+            f"Word '{english}' ➞ '{khmer}' created successfully!\nWord ID: {word_id}"
+        )  
+        msg.exec()
+        
+    def create_failed(self, message):
+        """Report a failed CREATE operation from the worker"""
+        msg = self.font_manager.create_message_box(
+            self, QMessageBox.Icon.Warning,
+            "Error",
+            message
+        )
+        msg.exec()
     
     def view_selected_word(self):
         """READ operation - View detailed information about selected word"""
-        selection = self.table_view.selectionModel().selectedRows()
-        if not selection:
+        index = self.table_view.currentIndex()
+        if not index.isValid() or not self.table_view.selectionModel().hasSelection():
             msg = self.font_manager.create_message_box(
                 self, QMessageBox.Icon.Warning,
                 "No Selection",
@@ -797,7 +1183,7 @@ class DictionaryManagerWidget(QWidget):
             msg.exec()
             return
         
-        row = selection[0].row()
+        row = index.row()
         word_data = self.table_model.get_row_data(row)
         if word_data:
             dialog = WordDetailsDialog(word_data, self.font_manager, self)
@@ -829,82 +1215,48 @@ class DictionaryManagerWidget(QWidget):
             msg.exec()
             return
     
-        try:
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            updates = []
-            params = []
-            if english:
-                updates.append("english_word = ?")
-                params.append(english.lower().strip())
-            if khmer:
-                updates.append("khmer_word = ?")
-                params.append(khmer.strip())
-            if word_type:
-                updates.append("word_type = ?")
-                params.append(word_type)
-            if definition:
-                updates.append("definition = ?")
-                params.append(definition)
-            if example:
-                updates.append("example_sentence = ?")
-                params.append(example)
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            params.append(self.current_edit_id)
-        
-            if updates:
-                query = f"UPDATE dictionary SET {', '.join(updates)} WHERE id = ?"
-                cursor.execute(query, params)
-                affected_rows = cursor.rowcount
-                conn.commit()
-                conn.close()
-            
-                if affected_rows > 0:
-                    self.cancel_edit()
-                    self.refresh_dictionary()
-                    self.word_updated.emit(self.current_edit_id)
-                    msg = self.font_manager.create_message_box(
-                        self, QMessageBox.Icon.Information,
-                        "Success",
-                        f"Word updated successfully!\nNew values: '{english}' ➞ '{khmer}'"
-                    )
-                    msg.exec()
-                else:
-                    msg = self.font_manager.create_message_box(
-                        self, QMessageBox.Icon.Warning,
-                        "Update Failed",
-                        "No changes were made to the word."
-                    )
-                    msg.exec()
-            else:
-                msg = self.font_manager.create_message_box(
-                    self, QMessageBox.Icon.Warning,
-                    "No Changes",
-                    "No fields were modified."
-                )
-                msg.exec()
-        except sqlite3.IntegrityError:
+        # The form always shows every field, so all five are written back
+        word_id = self.current_edit_id
+        task = DbTask(self.db.update_word, word_id, english, khmer, word_type, definition, example)
+        task.signals.finished.connect(
+            lambda updated: self.update_finished(updated, word_id, english, khmer)
+        )
+        task.signals.error.connect(self.update_failed)
+        QThreadPool.globalInstance().start(task)
+        
+    def update_finished(self, updated, word_id, english, khmer):
+        """Finish UPDATE operation once the worker has written the changes"""
+        if updated:
+            self.cancel_edit()
+            self.refresh_table_word(word_id)
+            self.word_updated.emit(word_id)
             msg = self.font_manager.create_message_box(
-                self, QMessageBox.Icon.Warning,
-                "Update Error",
-                f"Word '{english}' already exists in the dictionary."
+                self, QMessageBox.Icon.Information,
+                "Success",
+                f"Word updated successfully!\nNew values: '{english}' ➞ '{khmer}'"
             )
             msg.exec()
-        except Exception as e:
+        else:
             msg = self.font_manager.create_message_box(
-                self, QMessageBox.Icon.Critical,
-                "Update Error",
-                f"Failed to update word: {str(e)}"
+                self, QMessageBox.Icon.Warning,
+                "Update Failed",
+                "No changes were made to the word."
             )
             msg.exec()
-        finally:
-            if 'conn' in locals():
-                conn.close()
+            
+    def update_failed(self, message):
+        """Report a failed UPDATE operation from the worker"""
+        msg = self.font_manager.create_message_box(
+            self, QMessageBox.Icon.Warning,
+            "Update Error",
+            message
+        )
+        msg.exec()
             
     def edit_selected_word(self):
         """Prepare UPDATE operation - Load selected word into form for editing"""
-        selection = self.table_view.selectionModel().selectedRows()
-        if not selection:
+        index = self.table_view.currentIndex()
+        if not index.isValid() or not self.table_view.selectionModel().hasSelection():
             msg = self.font_manager.create_message_box(
                 self, QMessageBox.Icon.Warning,
                 "No Selection",
@@ -913,7 +1265,7 @@ class DictionaryManagerWidget(QWidget):
             msg.exec()
             return
     
-        row = selection[0].row()
+        row = index.row()
         word_data = self.table_model.get_row_data(row)
         if word_data:
             word_id, english, khmer, word_type, definition, example = word_data[:6]
@@ -936,8 +1288,8 @@ class DictionaryManagerWidget(QWidget):
             
     def delete_selected_word(self):
         """DELETE operation - Remove selected word from dictionary"""
-        selection = self.table_view.selectionModel().selectedRows()
-        if not selection:
+        index = self.table_view.currentIndex()
+        if not index.isValid() or not self.table_view.selectionModel().hasSelection():
             msg = self.font_manager.create_message_box(
                 self, QMessageBox.Icon.Warning,
                 "No Selection",
@@ -946,7 +1298,7 @@ class DictionaryManagerWidget(QWidget):
             msg.exec()
             return
     
-        row = selection[0].row()
+        row = index.row()
         word_data = self.table_model.get_row_data(row)
         if word_data:
             word_id, english, khmer = word_data[0], word_data[1], word_data[2]
@@ -958,65 +1310,158 @@ class DictionaryManagerWidget(QWidget):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if msg.exec() == QMessageBox.StandardButton.Yes:
-                try:
-                    conn = sqlite3.connect(self.db.db_path)
-                    cursor = conn.cursor()
-                    cursor.execute("DELETE FROM dictionary WHERE id = ?", (word_id,))
-                    affected_rows = cursor.rowcount
-                    conn.commit()
-                    conn.close()
+                task = DbTask(self.db.delete_word, word_id)
+                task.signals.finished.connect(
+                    lambda deleted: self.delete_finished(deleted, word_id, english, khmer)
+                )
+                task.signals.error.connect(self.delete_failed)
+                QThreadPool.globalInstance().start(task)
                 
-                    if affected_rows > 0:
-                        self.refresh_dictionary()
-                        self.word_deleted.emit(word_id)
-                        success_msg = self.font_manager.create_message_box(
-                            self, QMessageBox.Icon.Information,
-                            "Success",
-                            f"Word '{english}' ➞ '{khmer}' deleted successfully!"
-                        )
-                        success_msg.exec()
-                    else:
-                        error_msg = self.font_manager.create_message_box(
-                            self, QMessageBox.Icon.Warning,
-                            "Delete Failed",
-                            "Failed to delete the word. It may have already been removed."
-                        )
-                        error_msg.exec()
-                except Exception as e:
-                    error_msg = self.font_manager.create_message_box(
-                        self, QMessageBox.Icon.Critical,
-                        "Delete Error",
-                        f"Failed to delete word: {str(e)}"
-                    )
-                    error_msg.exec()
+    def delete_finished(self, deleted, word_id, english, khmer):
+        """Finish DELETE operation once the worker has removed the word"""
+        if deleted:
+            self.remove_table_word(word_id)
+            self.word_deleted.emit(word_id)
+            success_msg = self.font_manager.create_message_box(
+                self, QMessageBox.Icon.Information,
+                "Success",
+                f"Word '{english}' ➞ '{khmer}' deleted successfully!"
+            )
+            success_msg.exec()
+        else:
+            error_msg = self.font_manager.create_message_box(
+                self, QMessageBox.Icon.Warning,
+                "Delete Failed",
+                "Failed to delete the word. It may have already been removed."
+            )
+            error_msg.exec()
+            
+    def delete_failed(self, message):
+        """Report a failed DELETE operation from the worker"""
+        error_msg = self.font_manager.create_message_box(
+            self, QMessageBox.Icon.Critical,
+            "Delete Error",
+            message
+        )
+        error_msg.exec()
     
     def refresh_dictionary(self):
         """Refresh the table view with current database data"""
-        words = self.db.read_all_words()
-        self.table_model.update_data(words)
-        self.stats_label.setText(f"Total entries: {len(words)}")
+        # Only the first page is read now, the view fetches more as it scrolls
+        self._last_filter_text = ""
+        self.start_table_read(self.show_first_page, self.db.read_first_page, DictionaryTableModel.PAGE_SIZE)
+        
+    def start_table_read(self, on_finished, fn, *args):
+        """Read table rows on a worker thread, keeping only the newest read's result"""
+        self._read_generation += 1
+        generation = self._read_generation
+        task = DbTask(fn, *args)
+        task.signals.finished.connect(lambda result: self.table_read_finished(generation, on_finished, result))
+        QThreadPool.globalInstance().start(task)
+        
+    def table_read_finished(self, generation, on_finished, result):
+        """Apply a worker's rows unless a newer refresh or filter has started since"""
+        if generation == self._read_generation:
+            on_finished(result)
+            
+    def show_first_page(self, result):
+        """Show the first page of all words once the worker has read it"""
+        self._total_count, rows = result
+        self.table_model.set_page_source(self.db.read_words_page, rows)
+        self.stats_label.setText(f"Total entries: {self._total_count}")
+        
+    def add_table_word(self, word_id):
+        """Append a newly created word to the table without reloading everything"""
+        row_data = self.db.read_by_id(word_id)
+        if row_data is None:
+            self.refresh_dictionary()
+            return
+        
+        self._total_count += 1
+        if self.filter_input.text().strip():
+            # The cached filter result predates this word
+            self._last_filter_text = ""
+            self._run_filter()
+        else:
+            self.table_model.insert_row(row_data)
+            self.update_count_label()
+            
+    def refresh_table_word(self, word_id):
+        """Reload a single edited word into the table"""
+        row_data = self.db.read_by_id(word_id)
+        if row_data is None:
+            self.refresh_dictionary()
+            return
+        
+        self._last_filter_text = ""
+        if self.filter_input.text().strip():
+            # The edited word may no longer match the active filter
+            self._run_filter()
+        else:
+            self.table_model.update_row(word_id, row_data)
+        
+    def remove_table_word(self, word_id):
+        """Drop a deleted word from the table without reloading everything"""
+        self._last_filter_text = ""
+        self._total_count -= 1
+        self.table_model.remove_row_by_id(word_id)
+        self.update_count_label()
+        
+    def update_count_label(self):
+        """Show the entry count, relative to the total while a filter is active"""
+        if self.filter_input.text().strip():
+            self.stats_label.setText(f"Showing {self.table_model.rowCount()} of {self._total_count} entries")
+        else:
+            self.stats_label.setText(f"Total entries: {self._total_count}")
         
     def filter_dictionary(self):
+        """Schedule filtering, restarting the debounce window on every edit"""
+        self._filter_timer.start()
+        
+    def _run_filter(self):
         """Filter dictionary entries based on search text"""
-        filter_text = self.filter_input.text().strip().lower()
+        filter_text = self.filter_input.text().strip()
         
         if not filter_text:
             self.refresh_dictionary()
             return
         
-        words = self.db.read_all_words()
-        filtered_words = []
+        # Extending the last filter can only drop matches, so narrow its rows in memory
+        if self._last_filter_text and filter_text.startswith(self._last_filter_text):
+            self.narrow_filter(filter_text)
+            return
         
-        for word in words:
-            word_id, english, khmer, word_type, definition, example, created, updated = word
-            if (filter_text in english.lower() or 
-                filter_text in khmer or 
-                filter_text in word_type.lower() or
-                filter_text in (definition or "").lower()):
-                filtered_words.append(word) 
-                
+        self.start_table_read(lambda rows: self.show_filtered_words(filter_text, rows),
+                              self.db.search_words, filter_text)
+        
+    @staticmethod
+    def filter_key(row_data):
+        """Fold the filtered columns the way SQLite's LIKE compares them"""
+        fields = (row_data[1], row_data[2], row_data[3] or "", row_data[4] or "")
+        return "\x00".join(fields).translate(NOCASE_TABLE)
+        
+    def narrow_filter(self, filter_text):
+        """Filter the last filter's rows instead of querying the whole table"""
+        # Results of a database read still in flight are older than this one
+        self._read_generation += 1
+        if self._last_filter_keys is None:
+            self._last_filter_keys = [self.filter_key(row_data) for row_data in self._last_filter_rows]
+        
+        folded = filter_text.translate(NOCASE_TABLE)
+        matches = [(row_data, key) for row_data, key in zip(self._last_filter_rows, self._last_filter_keys)
+                   if folded in key]
+        self.show_filtered_words(filter_text, [row_data for row_data, key in matches],
+                                 [key for row_data, key in matches])
+        
+    def show_filtered_words(self, filter_text, filtered_words, filter_keys=None):
+        """Show the filter results and keep them for narrowing the next filter"""
+        self._last_filter_text = filter_text
+        self._last_filter_rows = filtered_words
+        self._last_filter_keys = filter_keys
+        
+        # The total count is kept from the last refresh
         self.table_model.update_data(filtered_words)
-        self.stats_label.setText(f"Showing {len(filtered_words)} of {len(words)} entries")
+        self.stats_label.setText(f"Showing {len(filtered_words)} of {self._total_count} entries")
     
     def cancel_edit(self):
         """Cancel edit mode and return to create mode"""
@@ -1038,34 +1483,27 @@ class DictionaryManagerWidget(QWidget):
         self.english_input.setFocus()
 
 class StatisticsWidget(QWidget):
-    def __init__(self, db, font_manager):
+    def __init__(self, db, font_manager, search_count=0):
         super().__init__()
         self.db = db
         self.font_manager = font_manager
-        self.search_count = 0
+        self.search_count = search_count
         self.init_ui()
         self.update_stats()
         
     def init_ui(self):
-        # Apply font to entire widget
-        self.font_manager.apply_font(self)
-        
         layout = QVBoxLayout()
         
         # Statistics section
         stats_group = QGroupBox("Dictionary Statistics")
-        self.font_manager.apply_font(stats_group, bold=True)
         stats_layout = QVBoxLayout()
         
         self.total_words_label = QLabel()
-        self.font_manager.apply_font(self.total_words_label)
         
         self.word_types_label = QLabel()
-        self.font_manager.apply_font(self.word_types_label)
         self.word_types_label.setWordWrap(True)
         
         self.searches_label = QLabel()
-        self.font_manager.apply_font(self.searches_label)
         
         stats_layout.addWidget(self.total_words_label)
         stats_layout.addWidget(self.word_types_label)
@@ -1077,13 +1515,11 @@ class StatisticsWidget(QWidget):
         # Sample words
         sample_group = QGroupBox("Sample Khmer Words")
         sample_group.setFixedHeight(490)
-        self.font_manager.apply_font(sample_group, bold=True)
         
         sample_layout = QVBoxLayout()
         
         self.sample_display = QTextBrowser()
         self.sample_display.setMaximumHeight(600)
-        self.font_manager.apply_font(self.sample_display)
         
         sample_layout.addWidget(self.sample_display)
         sample_group.setLayout(sample_layout)
@@ -1093,11 +1529,9 @@ class StatisticsWidget(QWidget):
         button_layout = QHBoxLayout()
         
         update_btn = QPushButton("Update Statistics")
-        self.font_manager.apply_font(update_btn)
         update_btn.clicked.connect(self.update_stats)
         
         export_btn = QPushButton("Export Word List")
-        self.font_manager.apply_font(export_btn)
         export_btn.clicked.connect(self.export_word_list)
         
         button_layout.addWidget(update_btn)
@@ -1110,16 +1544,10 @@ class StatisticsWidget(QWidget):
         self.setLayout(layout)
         
     def update_stats(self):
-        words = self.db.read_all_words()
-        
-        total_words = len(words)
+        total_words = self.db.get_total_count()
         self.total_words_label.setText(f"Total Dictionary Entries: {total_words}")
         
-        type_counts = {}
-        for word in words:
-            word_type = word[3]
-            type_counts[word_type] = type_counts.get(word_type, 0) + 1
-            
+        type_counts = self.db.get_type_counts()
         type_text = "Word Types: " + ", ".join([f"{t}: {c}" for t, c in type_counts.items()])
         self.word_types_label.setText(type_text)
         
@@ -1127,11 +1555,10 @@ class StatisticsWidget(QWidget):
         
         # Display sample words with Khmer font
         sample_words = self.db.get_random_words(10)
-        html_content = "<h3>Sample Words:</h3>"
-        for word in sample_words:
-            english, khmer = word[1], word[2]
-            html_content += f"<p><strong>{english}</strong> ➞ {khmer}</p>"
-            
+        html_content = "<h3>Sample Words:</h3>" + "".join(
+            f"<p><strong>{html.escape(word[1])}</strong> ➞ {html.escape(word[2])}</p>"
+            for word in sample_words
+        )
         self.sample_display.setHtml(html_content)
         
     def export_word_list(self):
@@ -1147,112 +1574,49 @@ class StatisticsWidget(QWidget):
         self.searches_label.setText(f"Searches This Session: {self.search_count}")
         
 class KhmerEnglishDictionaryApp(QMainWindow):
+    MANAGER_TAB = 1
+    STATS_TAB = 2
+    
     def __init__(self):
         super().__init__()
         self.db = DictionaryDatabase()
         self.font_manager = FontManager()
+        self.search_count = 0
         self.init_ui()
         self.connect_signals()
     
     def init_ui(self):
-        # Apply font to entire application
-        self.font_manager.apply_font(self)
-        
         self.setWindowTitle("Khmer-English Dictionary • វចនានុក្រមអង់គ្លេស-ខ្មែរ")
         self.setGeometry(100,100,1200,800)
         
         # Use standard Qt styling with Khmer font
-        self.setStyleSheet(f"""
-            QMainWindow{{
-                background-color: #f5f5f5;
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-            }}
-            QTabWidget::pane{{
-                border: 1px solid #c0c0c0;
-                background-color: white;
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-            }}
-            QTabBar::tab{{
-                background-color: #e0e0e0;
-                padding: 8px 16px;
-                margin-right: 2px;
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-            }}
-            QTabBar::tab:selected{{
-                background-color: white;
-                border-bottom: 2px solid #4a90e2;
-            }}
-            QGroupBox{{
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-            }}
-            QGroupBox::title{{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-            }}
-            QLineEdit, QComboBox, QPushButton, QTextEdit, QTextBrowser{{
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-                padding: 5px;
-            }}
-            QTableView{{
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-                gridline-color: #d0d0d0;
-            }}
-            QHeaderView::section{{
-                background-color: #e8e8e8;
-                padding: 8px;
-                border: 1px solid #c0c0c0;
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-                font-weight: bold;
-            }}
-            QLabel{{
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-            }}
-            * {{
-                font-family: '{self.font_manager.get_font_family()}';
-                font-size: {self.font_manager.font_size}pt;
-            }}
-        """)
+        fam = self.font_manager.get_font_family()
+        sz = self.font_manager.font_size
+        self.setStyleSheet(STYLESHEET_TEMPLATE.format(fam=fam, sz=sz))
         
         central_widget = QWidget()
-        self.font_manager.apply_font(central_widget)
         self.setCentralWidget(central_widget)
         
         layout = QVBoxLayout()
         central_widget.setLayout(layout)
         
         self.tab_widget = QTabWidget()
-        self.font_manager.apply_font(self.tab_widget)
         
         # Create tabs with CRUD functionality
+        # Manager and Statistics read the database when built, so they start as
+        # placeholders and are created the first time their tab is shown
         self.translator_tab = TranslatorWidgets(self.db, self.font_manager)
-        self.manager_tab = DictionaryManagerWidget(self.db, self.font_manager)
-        self.stats_tab = StatisticsWidget(self.db, self.font_manager)
+        self.manager_tab = None
+        self.stats_tab = None
         
         self.tab_widget.addTab(self.translator_tab, "Translator")
-        self.tab_widget.addTab(self.manager_tab, "Dictionary Manager (CRUD)")
-        self.tab_widget.addTab(self.stats_tab, "Statistics")
+        self.tab_widget.addTab(QWidget(), "Dictionary Manager (CRUD)")
+        self.tab_widget.addTab(QWidget(), "Statistics")
         
         layout.addWidget(self.tab_widget)
         
         # Status bar with Khmer font
         status_bar = self.statusBar()
-        self.font_manager.apply_font(status_bar)
         status_bar.showMessage("Ready - សូមស្វាគមន៍មកកាន់វចនានុក្រម (Welcome to the Dictionary)")
         
         # Focus on the first tab
@@ -1260,10 +1624,11 @@ class KhmerEnglishDictionaryApp(QMainWindow):
         
     def connect_signals(self):
         """Connect signals between widgets"""
-        self.translator_tab.word_searched.connect(
-            lambda word, search_type: self.stats_tab.increment_search_count()
-        )
+        self.translator_tab.word_searched.connect(self.on_word_searched)
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
+    def connect_manager_signals(self):
+        """Connect the Dictionary Manager signals once the tab has been built"""
         self.manager_tab.word_added.connect(
             lambda word: self.statusBar().showMessage(f"✔️ Created word: {word}")
         )
@@ -1275,7 +1640,43 @@ class KhmerEnglishDictionaryApp(QMainWindow):
         self.manager_tab.word_deleted.connect(
             lambda word_id: self.statusBar().showMessage(f"✔️ Deleted word ID: {word_id}")
         )
-    
+        
+    def on_word_searched(self, word, search_type):
+        """Count searches, including those made before Statistics is first shown"""
+        self.search_count += 1
+        if self.stats_tab is not None:
+            self.stats_tab.increment_search_count()
+            
+    def on_tab_changed(self, index):
+        """Build the Manager or Statistics tab the first time it is shown"""
+        if index == self.MANAGER_TAB and self.manager_tab is None:
+            self.manager_tab = DictionaryManagerWidget(self.db, self.font_manager)
+            self.connect_manager_signals()
+            self.replace_tab(index, self.manager_tab)
+        elif index == self.STATS_TAB and self.stats_tab is None:
+            self.stats_tab = StatisticsWidget(self.db, self.font_manager, self.search_count)
+            self.replace_tab(index, self.stats_tab)
+            
+    def replace_tab(self, index, widget):
+        """Swap a placeholder tab page for its real widget"""
+        placeholder = self.tab_widget.widget(index)
+        title = self.tab_widget.tabText(index)
+        
+        # Removing the current tab would re-enter on_tab_changed
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def closeEvent(self, event):
+        """Close the database connection on application exit"""
+        # Let queued and running DbTasks finish before their connection goes away
+        QThreadPool.globalInstance().waitForDone()
+        self.db.close()
+        super().closeEvent(event)
+
 def main():
     app = QApplication(sys.argv)
     